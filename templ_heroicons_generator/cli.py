@@ -3,25 +3,36 @@
 import argparse
 import sys
 import os
-import requests
-import traceback
 
-from .core import scanner
-from .core import downloader
-from .core import templ_builder
-from .core import config
 
+_parser: argparse.ArgumentParser | None = None
 
-def parse_args() -> argparse.Namespace:
+_FALSY_VALUES = frozenset({"false", "0", "no"})
+
+
+def _str2bool(value: str) -> bool:
+    """Interprets a command-line string as a boolean ('false', '0' and 'no' are False)."""
+    return str(value).lower() not in _FALSY_VALUES
+
+
+def _build_parser() -> argparse.ArgumentParser:
     """
-    Parses command-line arguments for the Heroicons Templ generator.
+    Builds the argument parser for the Heroicons Templ generator.
 
-    Defines and parses all available command-line options, providing default
-    values from the `core.config` module where appropriate.
+    Construction is memoized in the module-level `_parser` so that repeated
+    `parse_args()` calls in one process (e.g. from tests or an embedding
+    script) pay the argument and help-string setup cost only once.
 
     Returns:
-        An argparse.Namespace object containing the parsed command-line arguments.
+        The configured argparse.ArgumentParser instance.
     """
+    global _parser
+    if _parser is not None:
+        return _parser
+
+    from . import __version__
+    from .core import config
+
     parser = argparse.ArgumentParser(
         description="Generate a heroicons.templ file from used icons, optimized for production.",
         formatter_class=argparse.ArgumentDefaultsHelpFormatter,
@@ -49,7 +60,7 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--exclude-output",
-        type=lambda x: str(x).lower() not in ["false", "0", "no"],
+        type=_str2bool,
         default=True,
         help=(
             "Exclude source files (.templ, .go excluding _templ.go) within the --output-dir from scanning. "  # MODIFIED HELP TEXT
@@ -86,7 +97,30 @@ def parse_args() -> argparse.Namespace:
         default=config.DEFAULT_CACHE_DIR,
         help="Directory to store cached SVG files and the icon list.",
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--version",
+        action="version",
+        version=f"%(prog)s {__version__}",
+    )
+    _parser = parser
+    return parser
+
+
+def _noop(*args, **kwargs) -> None:
+    """No-op stand-in for print when verbose output is disabled."""
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parses command-line arguments for the Heroicons Templ generator.
+
+    Defines and parses all available command-line options, providing default
+    values from the `core.config` module where appropriate.
+
+    Returns:
+        An argparse.Namespace object containing the parsed command-line arguments.
+    """
+    args = _build_parser().parse_args()
 
     if args.silent:
         args.verbose = False
@@ -106,55 +140,149 @@ def main():
     5. Generates the .templ Go package file.
     Includes top-level error handling and program exit codes.
     """
+    # Fast path: answer --version without building the parser or touching
+    # the core package at all.
+    if len(sys.argv) > 1 and sys.argv[1] == "--version":
+        from . import __version__
+
+        print(f"{os.path.basename(sys.argv[0])} {__version__}")
+        sys.exit(0)
+
     args = parse_args()
     exit_code = 0
 
-    try:
-        if args.verbose:
-            print("Verbose mode enabled.")
+    # Bound once so verbose-only messages are plain log(...) calls instead of
+    # an `if args.verbose:` branch at every call site.
+    log = print if args.verbose else _noop
 
-        valid_icons_list = downloader.fetch_heroicons_list(
-            cache_dir=args.cache_dir, verbose=args.verbose, silent=args.silent
-        )
+    # Start loading the downloader module (and, transitively, requests — the
+    # most expensive import) on a background thread while the main thread
+    # imports the lighter modules below; the foreground
+    # `from .core import downloader` then mostly finds it in sys.modules.
+    import threading
+    from importlib import import_module
 
-        if (
-            not valid_icons_list and args.verbose
-        ):  # valid_icons_list can be an empty dict
-            print(
-                "  Warning: Could not fetch or parse the list of available icons (and no valid cache). "
-                "Validation against the official list will be skipped.",
-                file=sys.stderr,
-            )
+    def _prewarm_downloader():
+        try:
+            import_module(f"{__package__}.core.downloader")
+        except Exception:
+            pass  # the foreground import will surface any error
 
-        if args.verbose:
-            print("Scanning project for icon usage...")
-        icons_to_generate = scanner.find_used_icons(
+    threading.Thread(target=_prewarm_downloader, daemon=True).start()
+
+    # Imported here (not at module top) so that `--help` and argument errors
+    # exit before paying the cost of loading the scanner, downloader and
+    # templ builder modules (and, transitively, requests).
+    from .core import config
+    from .core import scanner
+    from .core import templ_builder
+    from .core import downloader
+
+    # Resolve the output target once up front; the dry-run path (and any
+    # future reporting) reuses these locals instead of re-deriving them.
+    target_path = os.path.join(args.output_dir, config.OUTPUT_FILENAME)
+    try:
+        rel_target_path = os.path.relpath(target_path)
+    except ValueError:
+        rel_target_path = target_path
+
+    try:
+        log("Verbose mode enabled.")
+
+        # Incremental fast path: compare a stat snapshot of the source tree
+        # against the manifest saved by the previous run. If nothing changed,
+        # the previous icon set is reused without fetching the icon list or
+        # re-reading any source file — and if the output file is also newer
+        # than the manifest, the whole run is a no-op. Arguments that change
+        # the generated output must match too, or the fast path would
+        # silently ignore them.
+        generation_options = {"default_class": args.default_class}
+        file_state = scanner.snapshot_source_files(
             input_dir=args.input_dir,
             output_dir_to_exclude=args.output_dir,
             exclude_output_dir_files=args.exclude_output,
-            verbose=args.verbose,
-            silent=args.silent,
-            valid_icons_list=valid_icons_list,
         )
+        manifest = scanner.load_scan_manifest(args.cache_dir)
+
+        if (
+            manifest is not None
+            and manifest.get("files") == file_state
+            and manifest.get("options") == generation_options
+        ):
+            if (
+                not args.force
+                and not args.dry_run
+                and os.path.exists(target_path)
+                and os.path.getmtime(target_path)
+                >= os.path.getmtime(scanner.get_scan_manifest_path(args.cache_dir))
+            ):
+                if args.verbose:
+                    log("Sources and output unchanged since last run. Nothing to do.")
+                elif not args.silent:
+                    print(f"'{rel_target_path}' is up-to-date (no source changes).")
+                return
+            icons_to_generate = scanner.icons_from_manifest(manifest)
+            log(
+                f"Sources unchanged since last run; reusing {len(icons_to_generate)} "
+                "icon(s) from the scan manifest."
+            )
+        else:
+            valid_icons_list = downloader.fetch_heroicons_list(
+                cache_dir=args.cache_dir, verbose=args.verbose, silent=args.silent
+            )
+
+            if not valid_icons_list:  # valid_icons_list can be an empty dict
+                log(
+                    "  Warning: Could not fetch or parse the list of available icons (and no valid cache). "
+                    "Validation against the official list will be skipped.",
+                    file=sys.stderr,
+                )
+
+            log("Scanning project for icon usage...")
+            icons_to_generate = scanner.find_used_icons(
+                input_dir=args.input_dir,
+                output_dir_to_exclude=args.output_dir,
+                exclude_output_dir_files=args.exclude_output,
+                verbose=args.verbose,
+                silent=args.silent,
+                valid_icons_list=valid_icons_list,
+            )
+            scanner.save_scan_manifest(
+                args.cache_dir, file_state, icons_to_generate, generation_options
+            )
 
         if not icons_to_generate and not args.dry_run and not args.silent:
             print(
                 "No icons found in project files matching the required format, or none were valid."
             )
 
-        if args.verbose and icons_to_generate:
-            print(
+        if icons_to_generate:
+            log(
                 f"Preparing to download/cache SVGs for {len(icons_to_generate)} icon(s)..."
             )
-        elif args.verbose and not icons_to_generate:
-            print("No icons to download/cache.")
-
-        valid_icons_data, download_errors = downloader.download_svgs(
-            icons_to_process=icons_to_generate,
-            verbose=args.verbose,
-            silent=args.silent,
-            cache_dir=args.cache_dir,
-        )
+        else:
+            log("No icons to download/cache.")
+
+        # Group downloads by URL path prefix (style, then file name) so
+        # same-prefix requests run back-to-back on the pooled keep-alive
+        # connections and hit warmer CDN caches. Generated output order is
+        # unaffected: download_svgs re-sorts results by component name.
+        icons_to_generate.sort(key=lambda icon: (icon.style, icon.file_name))
+
+        # One pooled session for the whole download phase: every SVG comes
+        # from the same host, so keep-alive connections are reused across
+        # icons instead of handshaking per request.
+        session = downloader.build_session()
+        try:
+            valid_icons_data, download_errors = downloader.download_svgs(
+                icons_to_process=icons_to_generate,
+                verbose=args.verbose,
+                silent=args.silent,
+                cache_dir=args.cache_dir,
+                session=session,
+            )
+        finally:
+            session.close()
 
         if download_errors > 0:
             print(
@@ -167,53 +295,51 @@ def main():
                     file=sys.stderr,
                 )
                 exit_code = 1
-            elif (
-                icons_to_generate and args.verbose
-            ):  # Check icons_to_generate before printing
-                print(
+            elif icons_to_generate:  # Check icons_to_generate before printing
+                log(
                     f"  Proceeding with {len(valid_icons_data)} successfully processed icon(s).",
                     file=sys.stderr,
                 )
 
         if exit_code == 0:  # Check exit_code before proceeding
-            # Only proceed if there are icons to generate or if it's a dry run (to show empty output)
-            # Or if user wants to generate an empty file if no icons were found (current behaviour)
-            # For now, let's keep the behaviour of generating an empty file if no icons are found,
-            # unless download_svgs failed catastrophically.
             if (
-                args.verbose and not valid_icons_data and icons_to_generate
+                not valid_icons_data and icons_to_generate
             ):  # Log if we identified icons but failed to get data
-                print(
+                log(
                     "  Note: No valid icon data to generate package from, though icons were identified."
                 )
-            elif args.verbose and not icons_to_generate:
-                print("  No icons identified to generate the package from.")
+            elif not icons_to_generate:
+                log("  No icons identified to generate the package from.")
 
-            if args.verbose:  # General message, even if valid_icons_data is empty
-                print("Generating Templ package...")
+            if not valid_icons_data and not args.dry_run:
+                # Nothing to include: skip the template compile and disk write
+                # entirely instead of producing an empty package file.
+                log("Skipping package generation (no icons to include).")
+                generated_content = None
+            else:
+                log("Generating Templ package...")  # Even if valid_icons_data is empty
 
-            generated_content = templ_builder.generate_heroicons_package(
-                output_dir=args.output_dir,
-                icons=valid_icons_data,  # Pass valid_icons_data which might be empty
-                force=args.force,
-                verbose=args.verbose,
-                silent=args.silent,
-                dry_run=args.dry_run,
-                default_class=args.default_class,
-            )
+                generated_content = templ_builder.generate_heroicons_package(
+                    output_dir=args.output_dir,
+                    icons=valid_icons_data,  # Pass valid_icons_data which might be empty
+                    force=args.force,
+                    verbose=args.verbose,
+                    silent=args.silent,
+                    dry_run=args.dry_run,
+                    default_class=args.default_class,
+                )
 
             if args.dry_run:
                 if generated_content:
-                    target_path = os.path.join(args.output_dir, config.OUTPUT_FILENAME)
-                    try:
-                        rel_target_path = os.path.relpath(target_path)
-                    except ValueError:
-                        rel_target_path = target_path
-                    print(
-                        f"\n--- Dry Run: Content that would be written to {rel_target_path} ---"
+                    # generate_heroicons_package normalizes its result to end
+                    # with a single newline, so the content can be emitted
+                    # as-is: one stdout write, no stripped copy of a
+                    # potentially large string.
+                    sys.stdout.write(
+                        f"\n--- Dry Run: Content that would be written to {rel_target_path} ---\n"
+                        f"{generated_content}"
+                        "--- End Dry Run ---\n"
                     )
-                    print(generated_content.strip())
-                    print("--- End Dry Run ---")
                 else:  # This case should ideally not happen if generate_heroicons_package always returns string on dry_run
                     print(
                         "\n--- Dry Run: No content was generated (or an issue occurred). ---"
@@ -228,29 +354,29 @@ def main():
     except KeyboardInterrupt:
         print("\nOperation cancelled by user.", file=sys.stderr)
         exit_code = 130
-    except requests.exceptions.RequestException as e:
-        print(
-            f"\nNetwork Error: A critical network error occurred: {e}", file=sys.stderr
-        )
-        if args.verbose:
-            traceback.print_exc(file=sys.stderr)
-        exit_code = 1
-    except FileNotFoundError as e:
-        print(f"\nFile System Error: {e}", file=sys.stderr)
-        if args.verbose:
-            traceback.print_exc(file=sys.stderr)
-        exit_code = 1
-    except OSError as e:
-        print(f"\nOS Error: {e}", file=sys.stderr)
-        if args.verbose:
-            traceback.print_exc(file=sys.stderr)
-        exit_code = 1
-    except RuntimeError as e:
-        print(f"\nRuntime Error: {e}", file=sys.stderr)
+    except (OSError, RuntimeError) as e:
+        # Expected failure modes: network errors (requests exceptions derive
+        # from OSError), file system problems, and RuntimeErrors raised by
+        # the builder. One handler, one friendly message per family.
+        if type(e).__module__.startswith("requests"):
+            print(
+                f"\nNetwork Error: A critical network error occurred: {e}",
+                file=sys.stderr,
+            )
+        elif isinstance(e, FileNotFoundError):
+            print(f"\nFile System Error: {e}", file=sys.stderr)
+        elif isinstance(e, OSError):
+            print(f"\nOS Error: {e}", file=sys.stderr)
+        else:
+            print(f"\nRuntime Error: {e}", file=sys.stderr)
         if args.verbose:
+            import traceback
+
             traceback.print_exc(file=sys.stderr)
         exit_code = 1
     except Exception as e:
+        import traceback
+
         print(f"\n--- Unexpected Error ---", file=sys.stderr)
         print(f"An unhandled error occurred: {e}", file=sys.stderr)
         print("\n--- Traceback ---", file=sys.stderr)
@@ -263,7 +389,14 @@ def main():
                 print("Script finished successfully.")
             else:
                 print(f"Script finished with errors (exit code {exit_code}).")
-        sys.exit(exit_code)
+        # Exit without running interpreter teardown (atexit hooks, module
+        # finalizers, GC of the imported requests machinery): for a
+        # short-lived CLI that teardown is pure overhead. The download
+        # executor and session are already shut down by this point; flush
+        # explicitly since os._exit bypasses stream finalization.
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(exit_code)
 
 
 if __name__ == "__main__":
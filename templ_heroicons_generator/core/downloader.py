@@ -4,6 +4,7 @@ import os
 import sys
 import json
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from hashlib import md5
 import time
 from typing import List, Dict, Tuple, TYPE_CHECKING
@@ -17,6 +18,15 @@ if TYPE_CHECKING:
 ICON_LIST_CACHE_FILENAME = "heroicons_list_cache.json"
 ICON_LIST_CACHE_DURATION_SECONDS = 24 * 60 * 60  # 24 hours
 
+MAX_DOWNLOAD_WORKERS = 8
+"""Maximum number of concurrent SVG downloads. Kept modest to avoid hammering
+raw.githubusercontent.com while still overlapping network round-trips."""
+
+# In-process memo for fetch_heroicons_list, keyed by absolute cache directory.
+# Complements the on-disk cache: repeated calls within one process (e.g. an
+# embedding script generating several packages) skip even the cache-file read.
+_icon_list_memo: Dict[str, Dict[str, List[str]]] = {}
+
 
 def get_cache_path(url: str, cache_dir: str) -> str:
     """
@@ -152,10 +162,16 @@ def fetch_heroicons_list(
         on failure if cache is also unavailable/invalid.
     """
     abs_cache_dir = os.path.abspath(cache_dir)
+    if abs_cache_dir in _icon_list_memo:
+        if verbose:
+            print("  Using in-process cached Heroicons list.")
+        return _icon_list_memo[abs_cache_dir]
+
     icon_list_cache_file = os.path.join(abs_cache_dir, ICON_LIST_CACHE_FILENAME)
 
     cached_icons = _read_icon_list_from_cache(icon_list_cache_file, verbose, silent)
     if cached_icons is not None:
+        _icon_list_memo[abs_cache_dir] = cached_icons
         return cached_icons
 
     if not silent and not verbose:
@@ -235,6 +251,8 @@ def fetch_heroicons_list(
 
     if api_fetch_successful:
         _write_icon_list_to_cache(icon_list_cache_file, icons_dict, verbose, silent)
+        # Failures are deliberately not memoized so a later call can retry.
+        _icon_list_memo[abs_cache_dir] = icons_dict
         return icons_dict
     else:
         if verbose:
@@ -245,17 +263,182 @@ def fetch_heroicons_list(
         return {}
 
 
+def build_session() -> requests.Session:
+    """
+    Creates a requests Session with a connection pool sized for the concurrent
+    SVG downloads.
+
+    Mounting an HTTPAdapter with an enlarged pool lets all SVG requests to
+    raw.githubusercontent.com reuse the same keep-alive TLS connections
+    instead of paying a TCP+TLS handshake per icon.
+
+    Returns:
+        A configured requests.Session instance. The caller owns it and is
+        responsible for closing it.
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=MAX_DOWNLOAD_WORKERS,
+        pool_maxsize=MAX_DOWNLOAD_WORKERS * 2,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _process_single_icon(
+    icon_obj: "Icon",
+    session: requests.Session,
+    abs_svg_cache_dir: str,
+    verbose: bool,
+) -> Tuple[bool, List[Tuple[str, str]]]:
+    """
+    Fetches and parses the SVG for a single icon, using the local cache first.
+
+    Designed to run on a worker thread: it does no printing itself and instead
+    returns its log lines for the caller to emit, so console output (including
+    the progress bar) stays serialized on the main thread.
+
+    Args:
+        icon_obj: The icon to fetch; its `.elements` attribute is populated in place.
+        session: The (thread-safe) requests session used for downloads.
+        abs_svg_cache_dir: Absolute path of the SVG cache directory.
+        verbose: If True, detailed per-step log lines are collected.
+
+    Returns:
+        A tuple (success, messages), where `messages` is a list of
+        (text, level) pairs in print order. Levels are 'info' (verbose only),
+        'warn' (suppressed when silent) and 'error' (always printed).
+    """
+    messages: List[Tuple[str, str]] = []
+    url = f"{config.HEROICONS_BASE_URL}/{icon_obj.style}/{icon_obj.file_name}.svg"
+    current_svg_cache_path = get_cache_path(url, abs_svg_cache_dir)
+
+    if verbose:
+        messages.append((f"      URL: {url}", "info"))
+        messages.append(
+            (f"      SVG Cache path: {os.path.relpath(current_svg_cache_path)}", "info")
+        )
+
+    svg_content: str | None = None
+
+    if os.path.exists(current_svg_cache_path):
+        if verbose:
+            messages.append(
+                (
+                    f"      SVG Cache hit. Reading from: {os.path.relpath(current_svg_cache_path)}",
+                    "info",
+                )
+            )
+        try:
+            with open(current_svg_cache_path, "r", encoding="utf-8") as f:
+                svg_content = f.read()
+        except Exception as e:
+            messages.append(
+                (
+                    f"    Warning: Error reading cached SVG {os.path.relpath(current_svg_cache_path)}: {e}. Retrying download.",
+                    "warn",
+                )
+            )
+    elif verbose:
+        messages.append(("      SVG Cache miss. Downloading...", "info"))
+
+    if svg_content is None:
+        try:
+            response = session.get(url, timeout=config.REQUEST_TIMEOUT)
+            response.raise_for_status()
+            svg_content = response.text
+
+            try:
+                os.makedirs(os.path.dirname(current_svg_cache_path), exist_ok=True)
+                with open(current_svg_cache_path, "w", encoding="utf-8") as f:
+                    f.write(svg_content)
+                if verbose:
+                    messages.append(
+                        (
+                            f"      Downloaded and cached SVG: {os.path.relpath(current_svg_cache_path)}",
+                            "info",
+                        )
+                    )
+            except Exception as e:
+                if verbose:
+                    messages.append(
+                        (
+                            f"    Warning: Downloaded '{icon_obj.component_name}' but failed to cache SVG to {os.path.relpath(current_svg_cache_path)}: {e}",
+                            "warn",
+                        )
+                    )
+
+        except requests.exceptions.RequestException as e:
+            status_code_str = "N/A"
+            if hasattr(e, "response") and e.response is not None:
+                status_code_str = str(e.response.status_code)
+            messages.append(
+                (
+                    f"    Error: Failed to download SVG {icon_obj.component_name} (HTTP {status_code_str}): {url}",
+                    "error",
+                )
+            )
+            return False, messages
+        except Exception as e:
+            messages.append(
+                (
+                    f"    Unexpected error during SVG download of {icon_obj.component_name}: {e}",
+                    "error",
+                )
+            )
+            return False, messages
+
+    if svg_content:
+        icon_obj.elements = core_icons.extract_svg_elements(svg_content)
+        if icon_obj.elements:
+            if verbose:
+                messages.append(
+                    (
+                        f"      Successfully processed {len(icon_obj.elements)} SVG element(s).",
+                        "info",
+                    )
+                )
+            return True, messages
+        messages.append(
+            (
+                f"    Warning: No graphical SVG elements extracted for {icon_obj.component_name} from {url}.",
+                "warn",
+            )
+        )
+        return False, messages
+
+    messages.append(
+        (
+            f"    Error: No SVG content for {icon_obj.component_name} after download/cache attempt.",
+            "error",
+        )
+    )
+    return False, messages
+
+
 def download_svgs(
-    icons_to_process: List["Icon"], verbose: bool, silent: bool, cache_dir: str
+    icons_to_process: List["Icon"],
+    verbose: bool,
+    silent: bool,
+    cache_dir: str,
+    session: requests.Session | None = None,
 ) -> Tuple[List["Icon"], int]:
     """
     Downloads SVG content for each icon, utilizing a local cache for individual SVGs.
 
+    Downloads run concurrently on a thread pool (capped at
+    `MAX_DOWNLOAD_WORKERS`) so network round-trips overlap; results are
+    re-sorted by component name to keep the output deterministic.
+
     Args:
         icons_to_process: A list of `Icon` objects that need their SVG data fetched.
         verbose: If True (and silent is False), prints detailed logs.
         silent: If True, suppresses all informational output except critical errors and progress bar.
         cache_dir: The directory to use for caching downloaded individual SVG files.
+        session: An optional requests Session to reuse for all downloads (e.g.
+                 one built by `build_session`). If None, a pooled session is
+                 created for this call and closed before returning.
 
     Returns:
         A tuple containing:
@@ -273,7 +456,9 @@ def download_svgs(
     processed_icons_with_data: List["Icon"] = []
     error_count = 0
     total_icons = len(icons_to_process)
-    session = requests.Session()
+    owns_session = session is None
+    if session is None:
+        session = build_session()
 
     try:
         os.makedirs(abs_svg_cache_dir, exist_ok=True)
@@ -320,104 +505,65 @@ def download_svgs(
         print(message, file=sys.stderr if is_error else sys.stdout)
         sys.stdout.flush()
 
-    for i, icon_obj in enumerate(icons_to_process):
-        if not verbose:
-            _print_progress(i, icon_obj.component_name)
+    completed_count = 0
+    max_workers = min(MAX_DOWNLOAD_WORKERS, total_icons)
 
-        url = f"{config.HEROICONS_BASE_URL}/{icon_obj.style}/{icon_obj.file_name}.svg"
-        current_svg_cache_path = get_cache_path(url, abs_svg_cache_dir)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        future_to_icon = {
+            executor.submit(
+                _process_single_icon, icon_obj, session, abs_svg_cache_dir, verbose
+            ): icon_obj
+            for icon_obj in icons_to_process
+        }
 
-        if verbose:
-            print(
-                f"    ({i+1}/{total_icons}) Processing {icon_obj.component_name} ({icon_obj.style}/{icon_obj.file_name}.svg)..."
-            )
-            print(f"      URL: {url}")
-            print(f"      SVG Cache path: {os.path.relpath(current_svg_cache_path)}")
+        for future in as_completed(future_to_icon):
+            icon_obj = future_to_icon[future]
+            try:
+                success, messages = future.result()
+            except Exception as e:
+                success = False
+                messages = [
+                    (
+                        f"    Unexpected error during SVG download of {icon_obj.component_name}: {e}",
+                        "error",
+                    )
+                ]
 
-        svg_content: str | None = None
+            completed_count += 1
 
-        if os.path.exists(current_svg_cache_path):
             if verbose:
                 print(
-                    f"      SVG Cache hit. Reading from: {os.path.relpath(current_svg_cache_path)}"
+                    f"    ({completed_count}/{total_icons}) Processed {icon_obj.component_name} ({icon_obj.style}/{icon_obj.file_name}.svg)"
                 )
-            try:
-                with open(current_svg_cache_path, "r", encoding="utf-8") as f:
-                    svg_content = f.read()
-            except Exception as e:
-                msg = f"    Warning: Error reading cached SVG {os.path.relpath(current_svg_cache_path)}: {e}. Retrying download."
-                if verbose:
-                    print(msg, file=sys.stderr)
-                elif not silent:
-                    _print_message_clean(msg, is_error=True)
-        elif verbose:
-            print(f"      SVG Cache miss. Downloading...")
-
-        if svg_content is None:
-            try:
-                response = session.get(url, timeout=config.REQUEST_TIMEOUT)
-                response.raise_for_status()
-                svg_content = response.text
-
-                try:
-                    os.makedirs(os.path.dirname(current_svg_cache_path), exist_ok=True)
-                    with open(current_svg_cache_path, "w", encoding="utf-8") as f:
-                        f.write(svg_content)
+            for text, level in messages:
+                if level == "info":
                     if verbose:
-                        print(
-                            f"      Downloaded and cached SVG: {os.path.relpath(current_svg_cache_path)}"
-                        )
-                except Exception as e:
+                        print(text)
+                elif level == "warn":
                     if verbose:
-                        print(
-                            f"    Warning: Downloaded '{icon_obj.component_name}' but failed to cache SVG to {os.path.relpath(current_svg_cache_path)}: {e}",
-                            file=sys.stderr,
-                        )
-
-            except requests.exceptions.RequestException as e:
-                status_code_str = "N/A"
-                if hasattr(e, "response") and e.response is not None:
-                    status_code_str = str(e.response.status_code)
-                error_msg = f"    Error: Failed to download SVG {icon_obj.component_name} (HTTP {status_code_str}): {url}"
-                if verbose:
-                    print(error_msg, file=sys.stderr)
-                else:
-                    _print_message_clean(error_msg, is_error=True)
-                error_count += 1
-                continue
-            except Exception as e:
-                error_msg = f"    Unexpected error during SVG download of {icon_obj.component_name}: {e}"
-                if verbose:
-                    print(error_msg, file=sys.stderr)
-                else:
-                    _print_message_clean(error_msg, is_error=True)
-                error_count += 1
-                continue
+                        print(text, file=sys.stderr)
+                    elif not silent:
+                        _print_message_clean(text, is_error=True)
+                else:  # error
+                    if verbose:
+                        print(text, file=sys.stderr)
+                    else:
+                        _print_message_clean(text, is_error=True)
 
-        if svg_content:
-            if verbose:
-                print(f"      Extracting SVG elements...")
-            icon_obj.elements = core_icons.extract_svg_elements(svg_content)
-            if icon_obj.elements:
+            if success:
                 processed_icons_with_data.append(icon_obj)
-                if verbose:
-                    print(
-                        f"      Successfully processed {len(icon_obj.elements)} SVG element(s)."
-                    )
             else:
-                msg = f"    Warning: No graphical SVG elements extracted for {icon_obj.component_name} from {url}."
-                if verbose:
-                    print(msg, file=sys.stderr)
-                elif not silent:
-                    _print_message_clean(msg, is_error=True)
                 error_count += 1
-        else:
-            error_msg = f"    Error: No SVG content for {icon_obj.component_name} after download/cache attempt."
-            if verbose:
-                print(error_msg, file=sys.stderr)
-            else:
-                _print_message_clean(error_msg, is_error=True)
-            error_count += 1
+
+            if not verbose:
+                _print_progress(completed_count - 1, icon_obj.component_name)
+
+    # as_completed yields in completion order; restore the scanner's
+    # deterministic ordering so the generated file is stable across runs.
+    processed_icons_with_data.sort(key=lambda ic: ic.component_name)
+
+    if owns_session:
+        session.close()
 
     if not verbose and not silent and total_icons > 0 and last_print_len > 0:
         print("\r" + " " * last_print_len + "\r", end="")
@@ -3,11 +3,173 @@
 import os
 import re
 import sys
-from typing import List, Dict, Set
+import json
+from typing import Any, List, Dict, Optional, Set
 
 from .icons import Icon, extract_icon_details
 from . import config
 
+SCAN_MANIFEST_FILENAME = "scan_manifest.json"
+
+
+def get_scan_manifest_path(cache_dir: str) -> str:
+    """Returns the path of the scan manifest file inside `cache_dir`."""
+    return os.path.join(os.path.abspath(cache_dir), SCAN_MANIFEST_FILENAME)
+
+
+def snapshot_source_files(
+    input_dir: str,
+    output_dir_to_exclude: str,
+    exclude_output_dir_files: bool,
+) -> Dict[str, List[float]]:
+    """
+    Collects a stat snapshot of every scannable source file under `input_dir`.
+
+    Walks the tree with os.scandir (unsorted, one stat per entry) and maps
+    each .templ / .go (excluding _templ.go) file path to its (mtime, size)
+    pair. The same output-directory exclusion rules as `find_used_icons`
+    apply, so an unchanged snapshot implies an identical scan result.
+
+    Args:
+        input_dir: The root directory of the project to snapshot.
+        output_dir_to_exclude: The output directory path to exclude.
+        exclude_output_dir_files: If True, files within `output_dir_to_exclude`
+                                  are not included in the snapshot.
+
+    Returns:
+        A dictionary mapping absolute file paths to [mtime, size] lists
+        (lists rather than tuples so the snapshot round-trips through JSON).
+
+    Raises:
+        FileNotFoundError: If the `input_dir` does not exist or is not a directory.
+    """
+    input_dir_abs_path = os.path.abspath(input_dir)
+    if not os.path.isdir(input_dir_abs_path):
+        raise FileNotFoundError(
+            f"Input directory '{input_dir}' (resolved to '{input_dir_abs_path}') not found or is not a directory."
+        )
+    abs_output_dir_to_exclude = os.path.abspath(output_dir_to_exclude)
+
+    file_state: Dict[str, List[float]] = {}
+    pending_dirs = [input_dir_abs_path]
+    while pending_dirs:
+        current_dir = pending_dirs.pop()
+        if exclude_output_dir_files and (
+            current_dir == abs_output_dir_to_exclude
+            or current_dir.startswith(abs_output_dir_to_exclude + os.sep)
+        ):
+            continue
+        try:
+            with os.scandir(current_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending_dirs.append(entry.path)
+                        continue
+                    if entry.name.endswith(".templ") or (
+                        entry.name.endswith(".go")
+                        and not entry.name.endswith("_templ.go")
+                    ):
+                        try:
+                            stat_result = entry.stat()
+                        except OSError:
+                            continue
+                        file_state[entry.path] = [
+                            stat_result.st_mtime,
+                            stat_result.st_size,
+                        ]
+        except OSError:
+            continue
+    return file_state
+
+
+def load_scan_manifest(cache_dir: str) -> Optional[Dict[str, Any]]:
+    """
+    Loads the scan manifest written by a previous run, if present and valid.
+
+    Args:
+        cache_dir: The cache directory the manifest was saved to.
+
+    Returns:
+        The manifest dictionary (with 'files', 'icons' and 'options' keys) on
+        success, None if the manifest is missing, unreadable or has an
+        invalid format.
+    """
+    manifest_path = get_scan_manifest_path(cache_dir)
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if (
+            isinstance(manifest, dict)
+            and isinstance(manifest.get("files"), dict)
+            and isinstance(manifest.get("icons"), list)
+            and isinstance(manifest.get("options"), dict)
+        ):
+            return manifest
+    except (OSError, json.JSONDecodeError):
+        pass
+    return None
+
+
+def save_scan_manifest(
+    cache_dir: str,
+    file_state: Dict[str, List[float]],
+    icons: List[Icon],
+    options: Dict[str, Any],
+) -> None:
+    """
+    Persists the source-file snapshot and resulting icon set for the next run.
+
+    Write failures are silently ignored: the manifest is purely an
+    optimization, and without it the next run simply falls back to a full scan.
+
+    Args:
+        cache_dir: The cache directory to write the manifest to.
+        file_state: The snapshot produced by `snapshot_source_files`.
+        icons: The icons found by `find_used_icons` for that snapshot.
+        options: The generation-affecting argument values (e.g. the default
+                 CSS class) the run used; a later run must match them before
+                 reusing this manifest.
+    """
+    manifest_path = get_scan_manifest_path(cache_dir)
+    manifest = {
+        "files": file_state,
+        "options": options,
+        "icons": [
+            {
+                "component_name": icon.component_name,
+                "file_name": icon.file_name,
+                "style": icon.style,
+            }
+            for icon in icons
+        ],
+    }
+    try:
+        os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+        with open(manifest_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+    except OSError:
+        pass
+
+
+def icons_from_manifest(manifest: Dict[str, Any]) -> List[Icon]:
+    """
+    Rebuilds the `Icon` objects recorded in a loaded scan manifest.
+
+    Args:
+        manifest: A manifest dictionary returned by `load_scan_manifest`.
+
+    Returns:
+        The list of `Icon` objects, in the order they were saved (sorted by
+        component name at scan time). Their `.elements` are left empty for
+        the downloader to populate, typically from the SVG cache.
+    """
+    return [
+        Icon(entry["component_name"], entry["file_name"], entry["style"])
+        for entry in manifest["icons"]
+        if isinstance(entry, dict)
+        and all(k in entry for k in ("component_name", "file_name", "style"))
+    ]
+
 
 def find_used_icons(
     input_dir: str,